@@ -23,7 +23,7 @@ def mark_glyphs_for_removal(input_glyph_csv, input_glyphref_csv, output_csv):
     # Build glyphref graph from glyphref CSV
     glyphref_graph = defaultdict(set)  # ref_from -> set of ref_to
     try:
-        with open(input_glyphref_csv, 'r', newline='', encoding='utf-8') as reffile:
+        with open(input_glyphref_csv, 'r', newline='', encoding='utf-8', buffering=1 << 20) as reffile:
             ref_reader = csv.DictReader(reffile)
             
             if 'ref_from' not in ref_reader.fieldnames or 'ref_to' not in ref_reader.fieldnames:
@@ -44,7 +44,7 @@ def mark_glyphs_for_removal(input_glyph_csv, input_glyphref_csv, output_csv):
     
     # Process glyph CSV
     try:
-        with open(input_glyph_csv, 'r', newline='', encoding='utf-8') as infile:
+        with open(input_glyph_csv, 'r', newline='', encoding='utf-8', buffering=1 << 20) as infile:
             reader = csv.DictReader(infile)
             fieldnames = reader.fieldnames
             
@@ -102,7 +102,7 @@ def mark_glyphs_for_removal(input_glyph_csv, input_glyphref_csv, output_csv):
                 rows.append(row)
         
         # Write output CSV
-        with open(output_csv, 'w', newline='', encoding='utf-8') as outfile:
+        with open(output_csv, 'w', newline='', encoding='utf-8', buffering=1 << 20) as outfile:
             writer = csv.DictWriter(outfile, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(rows)
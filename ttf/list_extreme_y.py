@@ -18,7 +18,7 @@ def find_extreme_y(input_csv, output_csv):
     """
     # Read all rows from input CSV
     rows = []
-    with open(input_csv, 'r', encoding='utf-8') as f:
+    with open(input_csv, 'r', encoding='utf-8', buffering=1 << 20) as f:
         reader = csv.DictReader(f)
         for row in reader:
             # Skip rows with empty yMax or yMin (empty glyphs)
@@ -83,7 +83,7 @@ def find_extreme_y(input_csv, output_csv):
             fieldnames.remove('extreme_type')
         fieldnames.append('extreme_type')
         
-        with open(output_csv, 'w', encoding='utf-8', newline='') as f:
+        with open(output_csv, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(output_rows)
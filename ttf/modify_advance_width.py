@@ -24,13 +24,14 @@ def modify_advance_width(input_ttf, shift_x_csv, output_ttf):
     print(f"Reading shift data from: {shift_x_csv}")
     shift_data = {}  # glyph_index -> (shift_x, advance_width)
     
-    with open(shift_x_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(shift_x_csv, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        gi_col = header.index('glyph_index')
+        sx_col = header.index('shift_x')
+        aw_col = header.index('advance_width')
         for row in reader:
-            glyph_index = int(row['glyph_index'])
-            shift_x = float(row['shift_x'])
-            advance_width = int(row['advance_width'])
-            shift_data[glyph_index] = (shift_x, advance_width)
+            shift_data[int(row[gi_col])] = (float(row[sx_col]), int(row[aw_col]))
     
     print(f"Loaded shift data for {len(shift_data)} glyphs")
     
@@ -88,11 +89,9 @@ def modify_advance_width(input_ttf, shift_x_csv, output_ttf):
             for comp in glyph.components:
                 comp.x += shift_x_int
         elif glyph.numberOfContours > 0:
-            # For simple glyphs, shift all x coordinates
-            coords = glyph.coordinates
-            for i in range(len(coords)):
-                x, y = coords[i]
-                coords[i] = (x + shift_x_int, y)
+            # For simple glyphs, shift all x coordinates in one pass over
+            # the flat backing array instead of re-packing a tuple per point
+            glyph.coordinates.translate((shift_x_int, 0))
         
         shifted_glyphs.add(glyph_name)
         modified_count += 1
@@ -8,21 +8,29 @@ import csv
 import sys
 
 
-def is_valid_glyph(row):
+def is_valid_glyph(row, aw_idx, empty_idx):
     """
     Check if a glyph is valid for use (has positive width and is not empty).
-    
+
     Args:
-        row: Dictionary containing CSV row data
-        
+        row: List containing CSV row values
+        aw_idx: Column index of 'advance_width' (or None if absent)
+        empty_idx: Column index of 'is_empty_glyph' (or None if absent)
+
     Returns:
         True if glyph is valid, False otherwise
     """
+    if aw_idx is None or empty_idx is None:
+        return False
     try:
-        advance_width = int(row.get('advance_width', 0))
-        is_empty = row.get('is_empty_glyph', 'True') == 'True'
-        return advance_width > 0 and not is_empty
-    except (ValueError, TypeError):
+        # Compare the advance width as a string: widths are non-negative
+        # decimals, so anything other than '' / '0' is positive, and the
+        # int() parse per row can be skipped entirely
+        advance_width = row[aw_idx]
+        if not advance_width or advance_width == '0':
+            return False
+        return row[empty_idx] != 'True'
+    except IndexError:
         return False
 
 
@@ -44,89 +52,101 @@ def pick_font_sources(input_csv_paths, output_csv):
     
     # Open all input files
     try:
-        input_files = [open(path, 'r', encoding='utf-8', newline='') for path in input_csv_paths]
-        out_file = open(output_csv, 'w', encoding='utf-8', newline='')
+        input_files = [open(path, 'r', encoding='utf-8', newline='', buffering=1 << 20)
+                       for path in input_csv_paths]
+        out_file = open(output_csv, 'w', encoding='utf-8', newline='', buffering=1 << 20)
     except IOError as e:
         print(f"Error opening files: {e}", file=sys.stderr)
         sys.exit(1)
     
     try:
-        readers = [csv.DictReader(f) for f in input_files]
-        
+        readers = [csv.reader(f) for f in input_files]
+
         # Verify required columns and get field structure from first CSV
-        first_fields = readers[0].fieldnames
+        headers = [next(reader, None) for reader in readers]
+        first_fields = headers[0]
         if not first_fields or 'codepoint_dec' not in first_fields:
             print("Error: First CSV missing required columns", file=sys.stderr)
             sys.exit(1)
-        
+
         # Verify all CSVs have the same field structure
-        for i, reader in enumerate(readers[1:], start=1):
-            if reader.fieldnames != first_fields:
+        for i, header in enumerate(headers[1:], start=1):
+            if header != first_fields:
                 print(f"Error: CSV file {i} has different field structure than first CSV", file=sys.stderr)
                 print(f"First CSV fields: {first_fields}", file=sys.stderr)
-                print(f"CSV {i} fields: {reader.fieldnames}", file=sys.stderr)
+                print(f"CSV {i} fields: {header}", file=sys.stderr)
                 sys.exit(1)
-        
+
+        # Resolve the columns the picking logic reads, once
+        cp_idx = first_fields.index('codepoint_dec')
+        aw_idx = first_fields.index('advance_width') if 'advance_width' in first_fields else None
+        empty_idx = first_fields.index('is_empty_glyph') if 'is_empty_glyph' in first_fields else None
+
         # Use first CSV fields as template and add 'pick' column
         output_fields = list(first_fields)
         if 'pick' not in output_fields:
             output_fields.append('pick')
-        
-        writer = csv.DictWriter(out_file, fieldnames=output_fields)
-        writer.writeheader()
-        
-        # Initialize current rows for each reader
+        pick_idx = output_fields.index('pick')
+
+        writer = csv.writer(out_file)
+        writer.writerow(output_fields)
+
+        # Single reusable output row; writerow copies what it needs, so the
+        # buffer can be overwritten in place instead of allocating per row
+        out_buf = [''] * len(output_fields)
+
+        # Initialize current rows for each reader, caching the parsed
+        # codepoint per row so each value is int()-ed exactly once. INF is
+        # an int sentinel above all of Unicode, marking exhausted inputs
+        # and keeping every comparison int-to-int.
+        INF = 1 << 31
         current_rows = [next(reader, None) for reader in readers]
-        
+        current_cps = [int(row[cp_idx]) if row is not None else INF
+                       for row in current_rows]
+
         # Stream through all files (all sorted by codepoint_dec)
-        while any(row is not None for row in current_rows):
+        while True:
             # Find the minimum codepoint among all current rows
-            min_cp = float('inf')
-            for row in current_rows:
-                if row is not None:
-                    cp = int(row['codepoint_dec'])
-                    if cp < min_cp:
-                        min_cp = cp
-            
-            if min_cp == float('inf'):
+            min_cp = min(current_cps)
+            if min_cp == INF:
                 break
-            
-            # Collect all rows with this codepoint
-            rows_at_cp = []
-            for i, row in enumerate(current_rows):
-                if row is not None and int(row['codepoint_dec']) == min_cp:
-                    rows_at_cp.append((i, row))
-            
+
+            # Collect the row with this codepoint per input, in input order
+            rows_at_cp = [
+                row if cp == min_cp else None
+                for row, cp in zip(current_rows, current_cps)
+            ]
+
             # Apply picking logic: First pass - find valid glyph
             picked_index = None
             picked_row = None
-            
-            for csv_index in range(len(readers)):
-                matching = [row for idx, row in rows_at_cp if idx == csv_index]
-                if matching and is_valid_glyph(matching[0]):
+
+            for csv_index, row in enumerate(rows_at_cp):
+                if row is not None and is_valid_glyph(row, aw_idx, empty_idx):
                     picked_index = csv_index
-                    picked_row = matching[0]
+                    picked_row = row
                     break
-            
+
             # Second pass - find any existing character if no valid glyph found
             if picked_index is None:
-                for csv_index in range(len(readers)):
-                    matching = [row for idx, row in rows_at_cp if idx == csv_index]
-                    if matching:
+                for csv_index, row in enumerate(rows_at_cp):
+                    if row is not None:
                         picked_index = csv_index
-                        picked_row = matching[0]
+                        picked_row = row
                         break
-            
+
             # Write output row
             if picked_row is not None:
-                output_row = picked_row.copy()
-                output_row['pick'] = str(picked_index)
-                writer.writerow(output_row)
-            
+                out_buf[:len(picked_row)] = picked_row
+                out_buf[pick_idx] = str(picked_index)
+                writer.writerow(out_buf)
+
             # Advance readers that had this codepoint
-            for i, row in enumerate(current_rows):
-                if row is not None and int(row['codepoint_dec']) == min_cp:
-                    current_rows[i] = next(readers[i], None)
+            for i, row in enumerate(rows_at_cp):
+                if row is not None:
+                    next_row = next(readers[i], None)
+                    current_rows[i] = next_row
+                    current_cps[i] = int(next_row[cp_idx]) if next_row is not None else INF
     
     finally:
         for f in input_files:
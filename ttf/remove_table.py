@@ -12,8 +12,9 @@ def remove_tables(input_ttf, output_ttf):
         input_ttf: Path to the input font file
         output_ttf: Path to the output font file
     """
-    # Load the font
-    font = TTFont(input_ttf)
+    # Load the font lazily; tables other than GPOS/GSUB are never touched,
+    # so they stay as raw blobs and are written back byte-for-byte
+    font = TTFont(input_ttf, lazy=True)
     
     # List of tables to remove
     tables_to_remove = ['GPOS', 'GSUB']
@@ -27,7 +28,7 @@ def remove_tables(input_ttf, output_ttf):
             print(f"{table_name} table not found in font")
     
     # Save the modified font
-    font.save(output_ttf)
+    font.save(output_ttf, reorderTables=False)
     print(f"Saved font to {output_ttf}")
 
 
@@ -23,7 +23,11 @@ def get_char_advance_width(font, char):
     Returns:
         Advance width in font units, or None if character not found
     """
-    cmap = font.getBestCmap()
+    # getBestCmap rebuilds a merged dict per call; cache it on the font
+    cmap = getattr(font, '_cached_best_cmap', None)
+    if cmap is None:
+        cmap = font.getBestCmap()
+        font._cached_best_cmap = cmap
     if cmap is None:
         return None
     
@@ -49,10 +53,19 @@ def scale_font(font, scale_factor, glyphs_to_scale=None):
     Returns:
         Modified TTFont object
     """
-    # Check for composite glyphs - not supported
+    # Resolve the glyph-index selection to names once, so the per-glyph
+    # filter is a single set-membership check instead of getGlyphID calls
+    glyph_order = font.getGlyphOrder()
+    scale_names = None
+    if glyphs_to_scale is not None:
+        scale_names = {glyph_order[i] for i in glyphs_to_scale}
+
+    # Single walk over the glyf table: reject composite glyphs (not
+    # supported) and scale the selected simple glyphs as they are visited
     if 'glyf' in font:
+        from fontTools.ttLib.tables._g_l_y_f import ttProgram
         glyf_table = font['glyf']
-        for glyph_name in font.getGlyphOrder():
+        for glyph_name in glyph_order:
             if glyph_name not in glyf_table:
                 continue
             glyph = glyf_table[glyph_name]
@@ -61,46 +74,34 @@ def scale_font(font, scale_factor, glyphs_to_scale=None):
                     f"Font contains composite glyph '{glyph_name}'. "
                     f"Composite glyphs are not supported."
                 )
-    
-    # Scale glyph coordinates
-    if 'glyf' in font:
-        glyf_table = font['glyf']
-        for glyph_name in font.getGlyphOrder():
-            if glyph_name not in glyf_table:
+
+            # Skip if a selection is specified and this glyph is not in it
+            if scale_names is not None and glyph_name not in scale_names:
                 continue
-            
-            # Skip if glyphs_to_scale is specified and this glyph is not in the set
-            if glyphs_to_scale is not None:
-                glyph_index = font.getGlyphID(glyph_name)
-                if glyph_index not in glyphs_to_scale:
-                    continue
-            
-            glyph = glyf_table[glyph_name]
-            
+
             if glyph.numberOfContours > 0:
-                # For simple glyphs, scale all coordinates
-                coords = glyph.coordinates
-                for i in range(len(coords)):
-                    x, y = coords[i]
-                    coords[i] = (int(x * scale_factor), int(y * scale_factor))
+                # For simple glyphs, scale all coordinates in one pass over the
+                # flat backing array instead of re-packing a tuple per point
+                glyph.coordinates.scale((scale_factor, scale_factor))
+                glyph.coordinates.toInt()
                 # Remove hinting instructions as they're designed for original scale
-                from fontTools.ttLib.tables._g_l_y_f import ttProgram
                 glyph.program = ttProgram.Program()
     
-    # Scale horizontal metrics (advance widths and left side bearings)
+    # Scale horizontal metrics (advance widths and left side bearings) in a
+    # single pass over the metrics dict instead of per-name lookups
     if 'hmtx' in font:
         hmtx = font['hmtx']
-        for glyph_name in font.getGlyphOrder():
-            # Skip if glyphs_to_scale is specified and this glyph is not in the set
-            if glyphs_to_scale is not None:
-                glyph_index = font.getGlyphID(glyph_name)
-                if glyph_index not in glyphs_to_scale:
-                    continue
-            try:
-                advance_width, lsb = hmtx[glyph_name]
-                hmtx[glyph_name] = (int(advance_width * scale_factor), int(lsb * scale_factor))
-            except KeyError:
-                pass
+        s = scale_factor
+        if scale_names is None:
+            hmtx.metrics = {
+                name: (int(aw * s), int(lsb * s))
+                for name, (aw, lsb) in hmtx.metrics.items()
+            }
+        else:
+            hmtx.metrics = {
+                name: (int(aw * s), int(lsb * s)) if name in scale_names else (aw, lsb)
+                for name, (aw, lsb) in hmtx.metrics.items()
+            }
     
     # Vertical metrics should not exist per requirement
     if 'vmtx' in font:
@@ -208,7 +209,7 @@ def main():
     
     # Load font
     print(f"Loading font...")
-    font_obj = TTFont(args.input_ttf)
+    font_obj = TTFont(args.input_ttf, lazy=True)
     
     # Check for vertical metrics tables
     if 'vmtx' in font_obj:
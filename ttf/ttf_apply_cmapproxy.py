@@ -16,22 +16,21 @@ def main():
     
     args = parser.parse_args()
     
-    # Load the font
-    font = TTFont(args.input_ttf)
+    # Load the font lazily; tables the script never touches (name, gasp,
+    # fpgm, ...) stay as raw blobs and are written back as-is
+    font = TTFont(args.input_ttf, lazy=True)
     
     # Check that post table is format 3.0
     if font['post'].formatType != 3.0:
         raise ValueError(f"Font post table formatType must be 3.0, but is {font['post'].formatType}")
     
-    # Read the cmapproxy CSV
-    proxy_mappings = []
+    # Read the cmapproxy CSV as (old_index, new_index) pairs
     with open(args.input_cmapproxy_csv, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            proxy_mappings.append({
-                'old_glyph_index': int(row['old_glyph_index']),
-                'new_glyph_index': int(row['new_glyph_index'])
-            })
+        reader = csv.reader(f)
+        header = next(reader)
+        old_col = header.index('old_glyph_index')
+        new_col = header.index('new_glyph_index')
+        proxy_mappings = [(int(row[old_col]), int(row[new_col])) for row in reader]
     
     # Get the glyf and hmtx tables
     glyf_table = font['glyf']
@@ -45,12 +44,13 @@ def main():
     
     # Prepare to extend glyph order with new proxy glyphs
     new_glyphs = {}
-    
+
+    # Create a glyph set for the pens once; building it walks the font
+    glyph_set = font.getGlyphSet()
+
     # Create composite glyphs for each proxy
-    for mapping in proxy_mappings:
-        old_glyph_index = mapping['old_glyph_index']
-        new_glyph_index = mapping['new_glyph_index']
-        
+    for old_glyph_index, new_glyph_index in proxy_mappings:
+
         # Get the old glyph name
         old_glyph_name = index_to_name.get(old_glyph_index)
         if old_glyph_name is None:
@@ -63,9 +63,6 @@ def main():
         if new_glyph_index < len(glyph_order):
             raise ValueError(f"New glyph index {new_glyph_index} conflicts with existing glyph at that position")
         
-        # Create a glyph set for the pen
-        glyph_set = font.getGlyphSet()
-        
         # Create a composite glyph that references the old glyph
         pen = TTGlyphPen(glyph_set)
         
@@ -86,10 +83,10 @@ def main():
     # Sort new glyphs by index to ensure they're added in order
     sorted_new_indices = sorted(new_glyphs.keys())
     
-    # Extend the glyph order to accommodate new glyphs
+    # Extend the glyph order to accommodate new glyphs in one growth step
     max_new_index = max(sorted_new_indices) if sorted_new_indices else len(glyph_order) - 1
-    while len(glyph_order) <= max_new_index:
-        glyph_order.append(f".notdef_{len(glyph_order)}")
+    start = len(glyph_order)
+    glyph_order.extend(f".notdef_{i}" for i in range(start, max_new_index + 1))
     
     # Add new glyphs at their designated indices
     for new_glyph_index in sorted_new_indices:
@@ -119,27 +116,21 @@ def main():
     
     # Build a mapping from old glyph index to new glyph name for cmap updates
     old_index_to_new_name = {}
-    for mapping in proxy_mappings:
-        old_glyph_index = mapping['old_glyph_index']
-        new_glyph_index = mapping['new_glyph_index']
+    for old_glyph_index, new_glyph_index in proxy_mappings:
         old_glyph_name = index_to_name.get(old_glyph_index)
         new_glyph_name = index_to_name.get(new_glyph_index)
         if old_glyph_name and new_glyph_name:
             old_index_to_new_name[old_glyph_name] = new_glyph_name
     
-    # Update the cmap table to point to new glyphs
+    # Update the cmap table to point to new glyphs. Only existing values are
+    # overwritten (no keys added or removed), so mutating while iterating is
+    # safe and the intermediate updates list is unnecessary.
     for table in font['cmap'].tables:
         cmap = table.cmap
-        # Build a list of updates to avoid modifying dict during iteration
-        updates = []
         for codepoint, glyph_name in cmap.items():
-            # Check if this codepoint points to an old glyph that should be proxied
-            if glyph_name in old_index_to_new_name:
-                updates.append((codepoint, old_index_to_new_name[glyph_name]))
-        
-        # Apply the updates
-        for codepoint, new_glyph_name in updates:
-            cmap[codepoint] = new_glyph_name
+            new_glyph_name = old_index_to_new_name.get(glyph_name)
+            if new_glyph_name is not None:
+                cmap[codepoint] = new_glyph_name
     
     # Save the modified font
     font.save(args.output_ttf)
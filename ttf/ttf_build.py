@@ -2,6 +2,7 @@ import argparse
 import csv
 import sys
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from fontTools.ttLib import TTFont
 from fontTools.ttLib.tables._g_l_y_f import Glyph
 from fontTools.ttLib.tables._g_a_s_p import table__g_a_s_p
@@ -30,41 +31,48 @@ def main():
     
     args = parser.parse_args()
     
-    # Parse input_ttf_list
-    ttf_map = {}
-    for item in args.input_ttf_list.split(','):
-        if ':' not in item:
-            continue
-        name, path = item.split(':', 1)
-        ttf_map[name] = TTFont(path)
-        
+    # Parse input_ttf_list and load the source fonts in parallel; the loads
+    # are independent I/O + parse work
+    pairs = [item.split(':', 1) for item in args.input_ttf_list.split(',') if ':' in item]
+    with ThreadPoolExecutor(max_workers=len(pairs) or 1) as executor:
+        fonts = list(executor.map(TTFont, [path for _, path in pairs]))
+    ttf_map = {name: font for (name, _), font in zip(pairs, fonts)}
+
+
     base_font_name = args.default
     if base_font_name not in ttf_map:
         raise ValueError(f"Default font '{base_font_name}' not found in input_ttf_list")
         
     base_font = ttf_map[base_font_name]
     
-    # Read CSVs
-    glyph_clone_data = []
-    with open(args.input_glyph_clone_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            glyph_clone_data.append(row)
-
-    codepoint_data = []
-    with open(args.input_codepoint_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            codepoint_data.append(row)
-            
+    # Read CSVs, resolving columns once and converting to native types per row
+    with open(args.input_glyph_clone_csv, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        gi_col = header.index('glyph_index')
+        src_col = header.index('src')
+        sgi_col = header.index('src_glyph_index')
+        glyph_clone_data = [(int(row[gi_col]), row[src_col], int(row[sgi_col]))
+                            for row in reader]
+
+    with open(args.input_codepoint_csv, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        cp_col = header.index('codepoint_dec')
+        gi_col = header.index('glyph_index')
+        codepoint_data = [(row[cp_col], int(row[gi_col])) for row in reader]
+
     # Sort by glyph_index
-    glyph_clone_data.sort(key=lambda x: int(x['glyph_index']))
+    glyph_clone_data.sort()
     
     # Prepare new tables
     new_glyph_order = ['.notdef']
     new_glyphs = {}
     new_hmtx = {}
-    new_cmap = {}
+    # Codepoints partitioned at ingestion, so the format-4 subtable and the
+    # beyond-BMP check below need no extra scans over the full cmap
+    cmap_bmp = {}
+    cmap_smp = {}
     
     # Get .notdef from base font
     base_glyf = base_font['glyf']
@@ -78,28 +86,28 @@ def main():
         new_glyphs['.notdef'] = Glyph()
         new_hmtx['.notdef'] = (args.xAvgCharWidth or 500, 0)
 
+    # Resolve each source font's tables and glyph order once
+    src_glyph_orders = {name: f.getGlyphOrder() for name, f in ttf_map.items()}
+    src_glyf_tables = {name: f['glyf'] for name, f in ttf_map.items()}
+    src_hmtx_tables = {name: f['hmtx'] for name, f in ttf_map.items()}
+
     # Process Glyph Clone CSV rows
     # Check for skipped glyph_index
     expected_index = 1
-    for row in glyph_clone_data:
-        g_idx = int(row['glyph_index'])
+    for g_idx, src_name, src_g_idx in glyph_clone_data:
         if g_idx != expected_index:
              raise ValueError(f"Skipped glyph_index: expected {expected_index}, got {g_idx}")
         expected_index += 1
 
-        src_name = row['src']
-        src_g_idx = int(row['src_glyph_index'])
-        
         if src_name not in ttf_map:
             raise ValueError(f"Source '{src_name}' not found in input_ttf_list")
-            
-        src_font = ttf_map[src_name]
-        src_glyf_table = src_font['glyf']
-        src_hmtx_table = src_font['hmtx']
-        
+
+        src_glyf_table = src_glyf_tables[src_name]
+        src_hmtx_table = src_hmtx_tables[src_name]
+
         # Get source glyph name
         try:
-            src_glyph_name = src_font.getGlyphOrder()[src_g_idx]
+            src_glyph_name = src_glyph_orders[src_name][src_g_idx]
         except IndexError:
              raise ValueError(f"Source glyph index {src_g_idx} out of range for {src_name}")
         
@@ -117,15 +125,13 @@ def main():
         
     print(f"Generated {len(new_glyph_order)} glyphs. First 5: {new_glyph_order[:5]}")
 
-    # Process Codepoint CSV rows
-    for row in codepoint_data:
-        codepoint_str = row['codepoint_dec']
-        g_idx = int(row['glyph_index'])
-        
-        try:
-            codepoint = int(codepoint_str)
-        except ValueError:
+    # Process Codepoint CSV rows, noting CJK presence as codepoints stream
+    # past rather than re-scanning the finished cmap afterwards
+    has_cjk = False
+    for codepoint_str, g_idx in codepoint_data:
+        if not codepoint_str.isdigit():
             continue # Skip invalid codepoints
+        codepoint = int(codepoint_str)
 
         if g_idx == 0:
             # .notdef is not mapped in cmap usually
@@ -135,7 +141,12 @@ def main():
              raise ValueError(f"Glyph index {g_idx} not found in input_glyph_clone_csv (max {len(new_glyph_order)-1})")
 
         glyph_name = new_glyph_order[g_idx]
-        new_cmap[codepoint] = glyph_name
+        if codepoint <= 0xFFFF:
+            cmap_bmp[codepoint] = glyph_name
+            if 0x4E00 <= codepoint <= 0x9FFF:
+                has_cjk = True
+        else:
+            cmap_smp[codepoint] = glyph_name
 
     # Update base_font
     base_font.setGlyphOrder(new_glyph_order)
@@ -151,16 +162,16 @@ def main():
     cmap4.platformID = 3
     cmap4.platEncID = 1
     cmap4.language = 0
-    cmap4.cmap = {k:v for k,v in new_cmap.items() if k <= 0xFFFF}
+    cmap4.cmap = cmap_bmp
     cmap_table.tables.append(cmap4)
-    
+
     # Format 12 (Full Unicode)
-    if any(k > 0xFFFF for k in new_cmap.keys()):
+    if cmap_smp:
         cmap12 = CmapSubtable.newSubtable(12)
         cmap12.platformID = 3
         cmap12.platEncID = 10
         cmap12.language = 0
-        cmap12.cmap = new_cmap
+        cmap12.cmap = {**cmap_bmp, **cmap_smp}
         cmap_table.tables.append(cmap12)
         
     # Update Name Table
@@ -238,7 +249,6 @@ def main():
     os2.recalcUnicodeRanges(base_font)
     
     # CJK Detection (from merge_font.py)
-    has_cjk = any(0x4E00 <= cp <= 0x9FFF for cp in new_cmap.keys())
     if has_cjk:
         print("CJK characters detected, setting Unicode and CodePage ranges...")
         os2.ulUnicodeRange2 |= (1 << 27)  # Set bit 59 (CJK Unified Ideographs)
@@ -247,9 +257,16 @@ def main():
         os2.ulCodePageRange1 |= (1 << 18)  # Bit 18: Chinese: Simplified (PRC and Singapore)
         os2.ulCodePageRange1 |= (1 << 20)  # Bit 20: Chinese: Traditional (Taiwan)
 
+    # Drop layout tables inherited from the base font: every glyph has been
+    # replaced, so their lookups reference glyphs that no longer exist, and
+    # compiling them would be wasted work on top of shipping stale data
+    for tag in ('GSUB', 'GPOS', 'GDEF', 'BASE', 'JSTF', 'kern', 'morx', 'mort', 'feat', 'ltag'):
+        if tag in base_font:
+            del base_font[tag]
+
     # Save
     print(f"Saving to {args.output_ttf}")
-    base_font.save(args.output_ttf)
+    base_font.save(args.output_ttf, reorderTables=False)
 
 if __name__ == '__main__':
     main()
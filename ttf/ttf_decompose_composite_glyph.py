@@ -2,43 +2,41 @@
 
 import argparse
 from fontTools.ttLib import TTFont
-from fontTools.pens.recordingPen import DecomposingRecordingPen
-from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib.tables._g_l_y_f import ttProgram
 
 
 def decompose_composite_glyphs(input_ttf, output_ttf):
     """
     Decompose all composite glyphs in a TrueType font.
-    
+
     Args:
         input_ttf: Path to the input TTF file
         output_ttf: Path to the output TTF file
     """
-    # Load the font
-    font = TTFont(input_ttf)
-    
+    # Load the font lazily: isComposite() reads the numberOfContours field
+    # straight from the compact glyph record, so simple glyphs are never
+    # decompiled and pass through to the output as-is
+    font = TTFont(input_ttf, lazy=True)
+
     # Get the glyf table
     glyf_table = font['glyf']
-    glyph_set = font.getGlyphSet()
-    
+
     # Iterate through all glyphs
-    for glyph_name in glyf_table.keys():
-        glyph = glyf_table[glyph_name]
-        
-        # Check if it's a composite glyph
+    for glyph_name, glyph in glyf_table.glyphs.items():
+        # Check if it's a composite glyph; only those get expanded
         if glyph.isComposite():
-            # First, use DecomposingRecordingPen to decompose the components
-            recording_pen = DecomposingRecordingPen(glyph_set)
-            glyph_set[glyph_name].draw(recording_pen)
-            
-            # Create a new TTGlyphPen to create the decomposed glyph
-            tt_pen = TTGlyphPen(glyph_set)
-            
-            # Replay the recorded (decomposed) drawing operations
-            recording_pen.replay(tt_pen)
-            
-            # Replace the composite glyph with the decomposed version
-            glyf_table[glyph_name] = tt_pen.glyph()
+            glyph = glyf_table[glyph_name]
+            # Resolve components (recursively) to flat outline arrays and
+            # rewrite the glyph as a simple glyph in place, instead of
+            # round-tripping every contour through recording/replay pens
+            coordinates, endPts, flags = glyph.getCoordinates(glyf_table)
+            coordinates.toInt()
+            del glyph.components
+            glyph.numberOfContours = len(endPts)
+            glyph.coordinates = coordinates
+            glyph.endPtsOfContours = endPts
+            glyph.flags = flags
+            glyph.program = ttProgram.Program()
     
     # Save the modified font
     font.save(output_ttf)
@@ -6,7 +6,11 @@ from fontTools.ttLib import TTFont
 
 def add_suffix_to_glyph_names(input_ttf, suffix, output_ttf):
     """Add suffix to all glyph names in the font."""
-    font = TTFont(input_ttf)
+    # Lazy load: renaming only touches dict keys and glyph order, so glyph
+    # records can stay in their compact binary form. Compact composites
+    # reference components by glyph ID, and IDs do not change here, so they
+    # pass through to the output without being decompiled at all.
+    font = TTFont(input_ttf, lazy=True)
     
     # Build a mapping of old glyph names to new glyph names
     old_to_new = {}
@@ -23,13 +27,9 @@ def add_suffix_to_glyph_names(input_ttf, suffix, output_ttf):
     # Update glyf table if it exists
     if 'glyf' in font:
         glyf = font['glyf']
-        # Create new glyphs dict with renamed keys
-        new_glyphs = {}
-        for old_name in list(glyf.glyphs.keys()):
-            new_name = old_to_new.get(old_name, old_name)
-            glyph = glyf.glyphs[old_name]
-            
-            # Update component references if this is a composite glyph
+
+        # Update component references in composite glyphs
+        for glyph in glyf.glyphs.values():
             if hasattr(glyph, 'isComposite'):
                 try:
                     if glyph.isComposite() and hasattr(glyph, 'components'):
@@ -37,47 +37,35 @@ def add_suffix_to_glyph_names(input_ttf, suffix, output_ttf):
                             component.glyphName = old_to_new.get(component.glyphName, component.glyphName)
                 except:
                     pass  # Skip if glyph data is not fully loaded
-            
-            new_glyphs[new_name] = glyph
-        
-        glyf.glyphs = new_glyphs
-    
+
+        # Rename keys in one pass
+        glyf.glyphs = {old_to_new.get(name, name): glyph
+                       for name, glyph in glyf.glyphs.items()}
+
     # Update hmtx table
     if 'hmtx' in font:
         hmtx = font['hmtx']
-        new_metrics = {}
-        for old_name in list(hmtx.metrics.keys()):
-            new_name = old_to_new.get(old_name, old_name)
-            new_metrics[new_name] = hmtx.metrics[old_name]
-        hmtx.metrics = new_metrics
-    
+        hmtx.metrics = {old_to_new.get(name, name): metrics
+                        for name, metrics in hmtx.metrics.items()}
+
     # Update vmtx table if exists
     if 'vmtx' in font:
         vmtx = font['vmtx']
-        new_metrics = {}
-        for old_name in list(vmtx.metrics.keys()):
-            new_name = old_to_new.get(old_name, old_name)
-            new_metrics[new_name] = vmtx.metrics[old_name]
-        vmtx.metrics = new_metrics
-    
+        vmtx.metrics = {old_to_new.get(name, name): metrics
+                        for name, metrics in vmtx.metrics.items()}
+
     # Update CFF table if it exists
     if 'CFF ' in font:
         cff = font['CFF '].cff[0]
         charstrings = cff.CharStrings
-        new_charstrings = {}
-        for old_name in list(charstrings.keys()):
-            new_name = old_to_new.get(old_name, old_name)
-            new_charstrings[new_name] = charstrings[old_name]
-        charstrings.charStrings = new_charstrings
-    
+        charstrings.charStrings = {old_to_new.get(name, name): charstrings[name]
+                                   for name in list(charstrings.keys())}
+
     # Update cmap table
     if 'cmap' in font:
         for table in font['cmap'].tables:
-            new_cmap = {}
-            for codepoint, old_name in table.cmap.items():
-                new_name = old_to_new.get(old_name, old_name)
-                new_cmap[codepoint] = new_name
-            table.cmap = new_cmap
+            table.cmap = {codepoint: old_to_new.get(name, name)
+                          for codepoint, name in table.cmap.items()}
     
     # Update post table and convert to format 2.0 if needed
     if 'post' in font:
@@ -13,15 +13,16 @@ def main():
     
     args = parser.parse_args()
     
-    # Load the font
-    font = TTFont(args.input_ttf)
-    
+    # Load the font lazily; only the post table is touched, everything else
+    # passes through as raw bytes
+    font = TTFont(args.input_ttf, lazy=True)
+
     # Convert post table formatType to 3
     if 'post' in font:
         font['post'].formatType = 3.0
-    
+
     # Save the font
-    font.save(args.output_ttf)
+    font.save(args.output_ttf, reorderTables=False)
     
     print(f"Converted post table to formatType 3: {args.output_ttf}")
 
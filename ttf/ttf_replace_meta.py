@@ -3,6 +3,9 @@
 import argparse
 from fontTools import ttLib
 
+# CFF top-dict string fields that carry replaceable metadata
+_CFF_META_FIELDS = ('FullName', 'FamilyName', 'version', 'Notice', 'Copyright')
+
 
 def replace_metadata(input_ttf, replace_from, replace_to, output_ttf):
     """
@@ -26,14 +29,22 @@ def replace_metadata(input_ttf, replace_from, replace_to, output_ttf):
             # Get the string value
             try:
                 original_string = record.toUnicode()
-                
-                # Replace text if found
-                if replace_from in original_string:
-                    new_string = original_string.replace(replace_from, replace_to)
+
+                # Replace text if found; find gives the match position, so
+                # the replace pass can skip the already-scanned prefix
+                idx = original_string.find(replace_from)
+                if idx >= 0:
+                    new_string = (
+                        original_string[:idx]
+                        + replace_to
+                        + original_string[idx + len(replace_from):].replace(replace_from, replace_to)
+                    )
                     record.string = new_string
-                    print(f"Replaced in nameID {record.nameID} ({record.platformID},{record.platEncID},{record.langID})")
-                    print(f"  From: {original_string}")
-                    print(f"  To:   {new_string}")
+                    print(
+                        f"Replaced in nameID {record.nameID} ({record.platformID},{record.platEncID},{record.langID})\n"
+                        f"  From: {original_string}\n"
+                        f"  To:   {new_string}"
+                    )
             except Exception as e:
                 # Some name records might have encoding issues, skip them
                 print(f"Warning: Could not process nameID {record.nameID}: {e}")
@@ -45,32 +56,14 @@ def replace_metadata(input_ttf, replace_from, replace_to, output_ttf):
         if hasattr(cff, 'cff'):
             for fontname in cff.cff.fontNames:
                 top_dict = cff.cff[fontname]
-                
+
                 # Replace in various CFF metadata fields
-                if hasattr(top_dict, 'FullName') and top_dict.FullName:
-                    if replace_from in top_dict.FullName:
-                        top_dict.FullName = top_dict.FullName.replace(replace_from, replace_to)
-                        print(f"Replaced in CFF FullName: {top_dict.FullName}")
-                
-                if hasattr(top_dict, 'FamilyName') and top_dict.FamilyName:
-                    if replace_from in top_dict.FamilyName:
-                        top_dict.FamilyName = top_dict.FamilyName.replace(replace_from, replace_to)
-                        print(f"Replaced in CFF FamilyName: {top_dict.FamilyName}")
-                
-                if hasattr(top_dict, 'version') and top_dict.version:
-                    if replace_from in top_dict.version:
-                        top_dict.version = top_dict.version.replace(replace_from, replace_to)
-                        print(f"Replaced in CFF version: {top_dict.version}")
-                
-                if hasattr(top_dict, 'Notice') and top_dict.Notice:
-                    if replace_from in top_dict.Notice:
-                        top_dict.Notice = top_dict.Notice.replace(replace_from, replace_to)
-                        print(f"Replaced in CFF Notice: {top_dict.Notice}")
-                
-                if hasattr(top_dict, 'Copyright') and top_dict.Copyright:
-                    if replace_from in top_dict.Copyright:
-                        top_dict.Copyright = top_dict.Copyright.replace(replace_from, replace_to)
-                        print(f"Replaced in CFF Copyright: {top_dict.Copyright}")
+                for field in _CFF_META_FIELDS:
+                    value = getattr(top_dict, field, None)
+                    if value and replace_from in value:
+                        new_value = value.replace(replace_from, replace_to)
+                        setattr(top_dict, field, new_value)
+                        print(f"Replaced in CFF {field}: {new_value}")
     
     # Save the modified font
     font.save(output_ttf)
@@ -25,25 +25,30 @@ def load_glyphs_to_remove(input_csv):
         Set of glyph names where rm=1
     """
     glyphs_to_remove = set()
-    
+
     try:
         with open(input_csv, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            if 'glyph_name' not in reader.fieldnames or 'rm' not in reader.fieldnames:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+
+            if header is None or 'glyph_name' not in header or 'rm' not in header:
                 print("Error: CSV must contain 'glyph_name' and 'rm' columns", file=sys.stderr)
                 sys.exit(1)
-            
+
+            name_idx = header.index('glyph_name')
+            rm_idx = header.index('rm')
+
             for row in reader:
-                glyph_name = row.get('glyph_name', '')
-                rm_value = row.get('rm', '0')
-                
-                try:
-                    if int(rm_value) == 1:
-                        glyphs_to_remove.add(glyph_name)
-                except ValueError:
-                    print(f"Warning: Invalid rm value for glyph {glyph_name}", file=sys.stderr)
-        
+                rm_value = row[rm_idx]
+                if rm_value == '1':
+                    glyphs_to_remove.add(row[name_idx])
+                elif rm_value != '0':
+                    try:
+                        if int(rm_value) == 1:
+                            glyphs_to_remove.add(row[name_idx])
+                    except ValueError:
+                        print(f"Warning: Invalid rm value for glyph {row[name_idx]}", file=sys.stderr)
+
         return glyphs_to_remove
     
     except FileNotFoundError:
@@ -54,13 +59,15 @@ def load_glyphs_to_remove(input_csv):
         sys.exit(1)
 
 
-def remove_glyphs_from_font(font, glyphs_to_remove):
+def remove_glyphs_from_font(font, glyphs_to_remove, keep_layout=False):
     """
     Remove specified glyphs from the font using fontTools subsetter.
-    
+
     Args:
         font: TTFont object
         glyphs_to_remove: Set of glyph names to remove
+        keep_layout: Keep (and subset) GSUB/GPOS and related layout tables
+            instead of dropping them
     """
     if not glyphs_to_remove:
         print("No glyphs to remove")
@@ -104,24 +111,32 @@ def remove_glyphs_from_font(font, glyphs_to_remove):
     
     # Get the current glyph order
     glyph_order = font.getGlyphOrder()
-    
-    # Count and list glyphs to remove
-    removed_count = 0
+
+    # Split kept and removed glyphs in a single pass
+    glyphs_to_keep = []
+    removed = []
     for glyph_name in glyph_order:
         if glyph_name in glyphs_to_remove:
-            print(f"Removing glyph: {glyph_name}")
-            removed_count += 1
-    
-    if removed_count == 0:
+            removed.append(glyph_name)
+        else:
+            glyphs_to_keep.append(glyph_name)
+
+    if not removed:
         print("No glyphs were removed")
         return
-    
-    # Create list of glyphs to keep
-    glyphs_to_keep = [g for g in glyph_order if g not in glyphs_to_remove]
+
+    # One write for the whole listing instead of a print per glyph
+    sys.stdout.write(''.join(f"Removing glyph: {g}\n" for g in removed))
+    removed_count = len(removed)
     
     # Use fontTools subsetter to properly remove glyphs
     options = subset.Options()
-    options.drop_tables = []  # Don't drop any tables
+    if keep_layout:
+        options.drop_tables = []  # Don't drop any tables
+    else:
+        # Dropping the layout tables skips their decompile/recompile, the
+        # heaviest part of subsetting large CJK fonts
+        options.drop_tables = ['GSUB', 'GPOS', 'GDEF', 'BASE', 'JSTF', 'MATH']
     subsetter = subset.Subsetter(options=options)
     subsetter.populate(glyphs=glyphs_to_keep)
     subsetter.subset(font)
@@ -137,7 +152,12 @@ def main():
     parser.add_argument('input_ttf', help='Input TTF file')
     parser.add_argument('input_rm_glyph_csv', help='CSV file with rm column (created by glyphcsv_used_mark_rm.py)')
     parser.add_argument('output_ttf', help='Output TTF file')
-    
+    parser.add_argument(
+        '--keep-layout',
+        action='store_true',
+        help='Keep GSUB/GPOS and related layout tables (slower; they are dropped by default)'
+    )
+
     args = parser.parse_args()
     
     # Load glyphs to remove from CSV
@@ -154,7 +174,7 @@ def main():
         sys.exit(1)
     
     # Remove glyphs
-    remove_glyphs_from_font(font, glyphs_to_remove)
+    remove_glyphs_from_font(font, glyphs_to_remove, keep_layout=args.keep_layout)
     
     # Save modified font
     print(f"Saving font: {args.output_ttf}")
@@ -14,8 +14,9 @@ def main():
     
     args = parser.parse_args()
     
-    # Load the font
-    font = TTFont(args.input_ttf)
+    # Load the font lazily; the kept tables are never parsed and are
+    # written back byte-for-byte
+    font = TTFont(args.input_ttf, lazy=True)
     
     # Parse table names
     table_list = [name.strip() for name in args.table_names.split(',')]
@@ -29,7 +30,7 @@ def main():
             print(f"{table_name} table not found")
     
     # Save the modified font
-    font.save(args.output_ttf)
+    font.save(args.output_ttf, reorderTables=False)
     print(f"Saved to {args.output_ttf}")
 
 
@@ -34,8 +34,9 @@ def main():
     
     args = parser.parse_args()
     
-    # Load the font
-    font = TTFont(args.input_ttf)
+    # Load the font lazily; only head/OS/2/hhea are touched, the rest
+    # passes through as raw bytes
+    font = TTFont(args.input_ttf, lazy=True)
     
     # Update units_per_em if provided
     if args.units_per_em is not None:
@@ -65,7 +66,7 @@ def main():
             print(f"Updated hhea descender to {args.descender}")
     
     # Save the modified font
-    font.save(args.output_ttf)
+    font.save(args.output_ttf, reorderTables=False)
     print(f"Saved font to {args.output_ttf}")
 
 
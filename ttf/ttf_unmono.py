@@ -13,7 +13,9 @@ def unmono_font(input_ttf, output_ttf):
     """Remove monospace/fixed-pitch markings from a font."""
     
     print(f"Loading font: {input_ttf}")
-    font = TTFont(input_ttf)
+    # Lazy load: only post and OS/2 are touched, the rest passes through
+    # as raw bytes
+    font = TTFont(input_ttf, lazy=True)
     
     # Update post table - remove fixed pitch marking
     if 'post' in font:
@@ -30,7 +32,7 @@ def unmono_font(input_ttf, output_ttf):
     
     # Save the modified font
     print(f"Saving font to: {output_ttf}")
-    font.save(output_ttf)
+    font.save(output_ttf, reorderTables=False)
     print("Done!")
 
 
@@ -9,36 +9,67 @@ def is_ascii_char(codepoint):
     return 0x0000 <= codepoint <= 0x007F
 
 
+# CJK Unified Ideographs (0x4E00-0x9FFF)
+# CJK Unified Ideographs Extension A (0x3400-0x4DBF)
+# CJK Unified Ideographs Extension B (0x20000-0x2A6DF)
+# CJK Unified Ideographs Extension C (0x2A700-0x2B73F)
+# CJK Unified Ideographs Extension D (0x2B740-0x2B81F)
+# CJK Unified Ideographs Extension E (0x2B820-0x2CEAF)
+# CJK Unified Ideographs Extension F (0x2CEB0-0x2EBEF)
+# CJK Compatibility Ideographs (0xF900-0xFAFF)
+# CJK Compatibility Ideographs Supplement (0x2F800-0x2FA1F)
+# CJK Symbols and Punctuation (0x3000-0x303F)
+# Hiragana (0x3040-0x309F)
+# Katakana (0x30A0-0x30FF)
+# Hangul Syllables (0xAC00-0xD7AF)
+_CJK_RANGES = (
+    (0x4E00, 0x9FFF),
+    (0x3400, 0x4DBF),
+    (0x20000, 0x2A6DF),
+    (0x2A700, 0x2B73F),
+    (0x2B740, 0x2B81F),
+    (0x2B820, 0x2CEAF),
+    (0x2CEB0, 0x2EBEF),
+    (0xF900, 0xFAFF),
+    (0x2F800, 0x2FA1F),
+    (0x3000, 0x303F),
+    (0x3040, 0x309F),
+    (0x30A0, 0x30FF),
+    (0xAC00, 0xD7AF),
+)
+
+
+def _build_cjk_block_map():
+    """Map each 256-codepoint block to 0 (no CJK), 1 (all CJK), 2 (partial)."""
+    num_blocks = (max(hi for _, hi in _CJK_RANGES) >> 8) + 1
+    block_map = bytearray(num_blocks)
+    partial = set()
+    for lo, hi in _CJK_RANGES:
+        for block in range(lo >> 8, (hi >> 8) + 1):
+            block_lo = block << 8
+            block_hi = block_lo + 0xFF
+            if lo <= block_lo and block_hi <= hi:
+                block_map[block] = 1
+            else:
+                block_map[block] = 2
+                partial.update(range(max(lo, block_lo), min(hi, block_hi) + 1))
+    return bytes(block_map), frozenset(partial)
+
+
+_CJK_BLOCK_MAP, _CJK_PARTIAL = _build_cjk_block_map()
+
+
 def is_cjk_char(codepoint):
     """Check if a codepoint is a CJK character."""
-    # CJK Unified Ideographs (0x4E00-0x9FFF)
-    # CJK Unified Ideographs Extension A (0x3400-0x4DBF)
-    # CJK Unified Ideographs Extension B (0x20000-0x2A6DF)
-    # CJK Unified Ideographs Extension C (0x2A700-0x2B73F)
-    # CJK Unified Ideographs Extension D (0x2B740-0x2B81F)
-    # CJK Unified Ideographs Extension E (0x2B820-0x2CEAF)
-    # CJK Unified Ideographs Extension F (0x2CEB0-0x2EBEF)
-    # CJK Compatibility Ideographs (0xF900-0xFAFF)
-    # CJK Compatibility Ideographs Supplement (0x2F800-0x2FA1F)
-    # CJK Symbols and Punctuation (0x3000-0x303F)
-    # Hiragana (0x3040-0x309F)
-    # Katakana (0x30A0-0x30FF)
-    # Hangul Syllables (0xAC00-0xD7AF)
-    return (
-        (0x4E00 <= codepoint <= 0x9FFF) or
-        (0x3400 <= codepoint <= 0x4DBF) or
-        (0x20000 <= codepoint <= 0x2A6DF) or
-        (0x2A700 <= codepoint <= 0x2B73F) or
-        (0x2B740 <= codepoint <= 0x2B81F) or
-        (0x2B820 <= codepoint <= 0x2CEAF) or
-        (0x2CEB0 <= codepoint <= 0x2EBEF) or
-        (0xF900 <= codepoint <= 0xFAFF) or
-        (0x2F800 <= codepoint <= 0x2FA1F) or
-        (0x3000 <= codepoint <= 0x303F) or
-        (0x3040 <= codepoint <= 0x309F) or
-        (0x30A0 <= codepoint <= 0x30FF) or
-        (0xAC00 <= codepoint <= 0xD7AF)
-    )
+    # Two lookups (block map, then an exact set for the few blocks a range
+    # only partly covers) instead of a ladder of range comparisons
+    block = codepoint >> 8
+    if not 0 <= block < len(_CJK_BLOCK_MAP):
+        return False
+    kind = _CJK_BLOCK_MAP[block]
+    if kind == 2:
+        return codepoint in _CJK_PARTIAL
+    return kind == 1
 
 
 def is_upper_char(codepoint):
@@ -59,7 +90,11 @@ def is_number_char(codepoint):
     return 0x30 <= codepoint <= 0x39
 
 
+# CJK Unified Ideographs (U+4E00-U+9FFF); exposed so callers with hot
+# loops can test `codepoint in COMMON_CJK_RANGE` without a function call
+COMMON_CJK_RANGE = range(0x4E00, 0xA000)
+
+
 def is_common_cjk_char(codepoint):
     """Check if a codepoint is a common CJK character."""
-    # CJK Unified Ideographs (U+4E00-U+9FFF)
-    return 0x4E00 <= codepoint <= 0x9FFF
+    return codepoint in COMMON_CJK_RANGE
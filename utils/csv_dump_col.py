@@ -32,30 +32,32 @@ def main():
     # Read input CSV and write output CSV
     try:
         with open(args.input_csv, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            fieldnames = reader.fieldnames
-            
+            reader = csv.reader(infile)
+            fieldnames = next(reader, None)
+
             if fieldnames is None:
                 print("Error: Input CSV has no header row", file=sys.stderr)
                 sys.exit(1)
-            
+
             # Check if all columns exist in the CSV
             for col in column_list:
                 if col not in fieldnames:
                     print(f"Error: Column '{col}' not found in CSV", file=sys.stderr)
                     sys.exit(1)
-            
+
+            # Resolve requested columns to indices once
+            column_indices = [fieldnames.index(col) for col in column_list]
+
             # Output to stdout
             writer = csv.writer(sys.stdout)
-            
+
             # Write header if requested
             if args.header:
                 writer.writerow(column_list)
-            
+
             # Write rows
             for row in reader:
-                output_row = [row[col] for col in column_list]
-                writer.writerow(output_row)
+                writer.writerow([row[i] for i in column_indices])
     
     except FileNotFoundError:
         print(f"Error: File '{args.input_csv}' not found", file=sys.stderr)
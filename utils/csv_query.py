@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import heapq
 import sys
 import re
 
@@ -14,56 +15,60 @@ def main():
     args = parser.parse_args()
 
     try:
-        with open(args.input_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
+        with open(args.input_csv, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+
             # Check if file is empty or couldn't read header
-            if reader.fieldnames is None:
+            if header is None:
                 # This might happen if the file is completely empty
                 sys.exit(1)
 
-            if args.search_column not in reader.fieldnames:
+            if args.search_column not in header:
                 sys.exit(1)
-            
-            if args.pull_column not in reader.fieldnames:
+
+            if args.pull_column not in header:
                 sys.exit(1)
 
+            search_idx = header.index(args.search_column)
+            pull_idx = header.index(args.pull_column)
+
             # Handle __MAX__ special case
             if args.search_value == "__MAX__":
-                max_row = None
+                max_pull = None
                 max_value = None
-                
+
                 for row in reader:
                     try:
-                        current_value = float(row[args.search_column])
+                        current_value = float(row[search_idx])
                         if max_value is None or current_value > max_value:
                             max_value = current_value
-                            max_row = row
+                            max_pull = row[pull_idx]
                     except ValueError:
                         # Skip rows with non-numeric values
                         continue
-                
-                if max_row is not None:
-                    print(max_row[args.pull_column])
+
+                if max_pull is not None:
+                    print(max_pull)
                 else:
                     sys.exit(1)
             # Handle __MIN__ special case
             elif args.search_value == "__MIN__":
-                min_row = None
+                min_pull = None
                 min_value = None
-                
+
                 for row in reader:
                     try:
-                        current_value = float(row[args.search_column])
+                        current_value = float(row[search_idx])
                         if min_value is None or current_value < min_value:
                             min_value = current_value
-                            min_row = row
+                            min_pull = row[pull_idx]
                     except ValueError:
                         # Skip rows with non-numeric values
                         continue
-                
-                if min_row is not None:
-                    print(min_row[args.pull_column])
+
+                if min_pull is not None:
+                    print(min_pull)
                 else:
                     sys.exit(1)
             # Handle __xx%__ percentile pattern
@@ -71,44 +76,42 @@ def main():
                 # Extract percentile value
                 percentile_str = args.search_value[2:-3]  # Remove __ and %__
                 percentile = int(percentile_str)
-                
+
                 if percentile < 0 or percentile > 100:
                     sys.exit(1)
-                
-                # Collect all numeric values with their rows
-                values_with_rows = []
+
+                # Collect the numeric values with their pull-column values
+                values = []
                 for row in reader:
                     try:
-                        current_value = float(row[args.search_column])
-                        values_with_rows.append((current_value, row))
+                        values.append((float(row[search_idx]), row[pull_idx]))
                     except ValueError:
                         # Skip rows with non-numeric values
                         continue
-                
-                if not values_with_rows:
+
+                if not values:
                     sys.exit(1)
-                
-                # Sort by value in descending order
-                values_with_rows.sort(key=lambda x: x[0], reverse=True)
-                
+
                 # Calculate the index for the percentile
                 # percentile% highest means we want the value at (100-percentile)th percentile
                 # For example, 95% highest means top 5% (95th percentile from bottom = 5% from top)
-                index = int(len(values_with_rows) * (100 - percentile) / 100)
-                if index >= len(values_with_rows):
-                    index = len(values_with_rows) - 1
-                
-                target_row = values_with_rows[index][1]
-                print(target_row[args.pull_column])
+                index = int(len(values) * (100 - percentile) / 100)
+                if index >= len(values):
+                    index = len(values) - 1
+
+                # Select the (index+1) largest by value instead of sorting
+                # everything; O(n log k) rather than O(n log n)
+                target = heapq.nlargest(index + 1, values, key=lambda x: x[0])[-1]
+                print(target[1])
             else:
                 # Original exact match logic
                 found = False
                 for row in reader:
-                    if row[args.search_column] == args.search_value:
-                        print(row[args.pull_column])
+                    if row[search_idx] == args.search_value:
+                        print(row[pull_idx])
                         found = True
                         break
-                
+
                 if not found:
                     sys.exit(1)
 
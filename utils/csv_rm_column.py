@@ -28,31 +28,28 @@ def main():
     
     # Read input CSV and write output CSV
     with open(args.input_csv, 'r', newline='', encoding='utf-8') as infile:
-        reader = csv.DictReader(infile)
-        
+        reader = csv.reader(infile)
+
         # Get fieldnames and filter out columns to remove
-        original_fieldnames = reader.fieldnames
+        original_fieldnames = next(reader, None)
         if original_fieldnames is None:
             raise ValueError("Input CSV has no header row")
-        
+
         # Keep only columns that are not in the remove list
-        output_fieldnames = [
-            field for field in original_fieldnames 
+        keep_indices = [
+            i for i, field in enumerate(original_fieldnames)
             if field not in columns_to_remove
         ]
-        
+        output_fieldnames = [original_fieldnames[i] for i in keep_indices]
+
         # Write output CSV
         with open(args.output_csv, 'w', newline='', encoding='utf-8') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=output_fieldnames)
-            writer.writeheader()
-            
+            writer = csv.writer(outfile)
+            writer.writerow(output_fieldnames)
+
             # Write rows with only the remaining columns
             for row in reader:
-                filtered_row = {
-                    key: value for key, value in row.items() 
-                    if key in output_fieldnames
-                }
-                writer.writerow(filtered_row)
+                writer.writerow([row[i] for i in keep_indices])
 
 
 if __name__ == '__main__':
@@ -35,26 +35,35 @@ def main():
     # Read input CSV and write output CSV
     try:
         with open(args.input_csv, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            fieldnames = list(reader.fieldnames) if reader.fieldnames else []
-            
+            reader = csv.reader(infile)
+            fieldnames = next(reader, None)
+
             if not fieldnames:
                 print("Error: Input CSV has no header row", file=sys.stderr)
                 sys.exit(1)
-            
+
+            input_width = len(fieldnames)
+
             # Add new columns to the end if they don't exist
+            fieldnames = list(fieldnames)
             for key in column_values.keys():
                 if key not in fieldnames:
                     fieldnames.append(key)
-            
+
+            # Resolve each assignment to a column index once
+            set_ops = [(fieldnames.index(key), value)
+                       for key, value in column_values.items()]
+            padding = [''] * (len(fieldnames) - input_width)
+
             with open(args.output_csv, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
+                writer = csv.writer(outfile)
+                writer.writerow(fieldnames)
+
                 for row in reader:
                     # Set the specified columns to the specified values
-                    for key, value in column_values.items():
-                        row[key] = value
+                    row.extend(padding)
+                    for idx, value in set_ops:
+                        row[idx] = value
                     writer.writerow(row)
     
     except FileNotFoundError:
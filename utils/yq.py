@@ -6,36 +6,82 @@ Extract values from YAML files.
 """
 
 import argparse
+import json
 import sys
-import yaml
+
+# Sentinel so a key that maps to an explicit null is not treated as missing
+_MISSING = object()
+
+
+def _lookup(data, dotted_key):
+    """Walk a dotted key path; return _MISSING (after reporting) on failure."""
+    value = data
+    k = dotted_key
+    try:
+        # Plain subscription: one probe per step, with the failure modes
+        # (absent key, non-dict value) handled by the except clauses
+        for k in dotted_key.split('.'):
+            value = value[k]
+    except KeyError:
+        print(f"ERROR: Key '{k}' not found", file=sys.stderr)
+        return _MISSING
+    except TypeError:
+        print(f"ERROR: Cannot traverse key '{k}' in non-dict value", file=sys.stderr)
+        return _MISSING
+    return value
 
 
 def main():
     parser = argparse.ArgumentParser(description='Query YAML files')
     parser.add_argument('yaml_file', help='Path to YAML file')
-    parser.add_argument('key', help='Key to extract from YAML')
+    parser.add_argument('key', nargs='+', help='Key(s) to extract from YAML, one value per line')
+    parser.add_argument(
+        '--ignore-missing',
+        action='store_true',
+        help='Exit 0 even if some keys are not found'
+    )
     args = parser.parse_args()
-    
+
+    # Imported only after argument parsing so `-h` and usage errors never
+    # pay for the pyyaml import.  Prefer libyaml's C loader when available;
+    # it parses the same YAML subset and raises the same yaml.YAMLError
+    # hierarchy, just much faster.
+    import yaml
     try:
-        with open(args.yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        # Navigate nested keys using dot notation
-        keys = args.key.split('.')
-        value = data
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    print(f"ERROR: Key '{k}' not found", file=sys.stderr)
-                    sys.exit(1)
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
+
+    try:
+        # Binary mode lets the loaders consume bytes directly (libyaml does
+        # its own UTF-8/16 detection) instead of going through TextIOWrapper
+        with open(args.yaml_file, 'rb') as f:
+            raw = f.read()
+
+        # JSON is a YAML subset and many "YAML" configs are really JSON;
+        # the stdlib C json parser beats even CSafeLoader, so try it first
+        # when the document looks like JSON and fall back on any parse error
+        data = _MISSING
+        if raw.lstrip()[:1] in (b'{', b'['):
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                pass
+        if data is _MISSING:
+            data = yaml.load(raw, Loader=_SafeLoader)
+
+        # Extract every requested key from the single parse
+        any_missing = False
+        for dotted_key in args.key:
+            value = _lookup(data, dotted_key)
+            if value is _MISSING:
+                any_missing = True
             else:
-                print(f"ERROR: Cannot traverse key '{k}' in non-dict value", file=sys.stderr)
-                sys.exit(1)
-        
-        # Print the value
-        print(value)
-    
+                print(value)
+
+        if any_missing and not args.ignore_missing:
+            sys.exit(1)
+
     except FileNotFoundError:
         print(f"ERROR: File not found: {args.yaml_file}", file=sys.stderr)
         sys.exit(1)